@@ -0,0 +1,116 @@
+# pyright: basic
+"""
+Compares the python models generated for `test/samples/many.json`:
+decode throughput and memory per instance of the `User` model.
+
+    pip install -e '.[bench]'
+    python -m benchmarks.structs --count 100000
+
+Run it from the repository root. The `bench` extra installs mongoengine and msgspec;
+a target whose library is missing is reported as skipped.
+"""
+
+from argparse import ArgumentParser
+from collections.abc import Callable
+import importlib.util
+import json
+import os
+import sys
+import time
+import tracemalloc
+import types
+from flexschema.schema.schema import AnySchema, SchemaBase, parse
+from flexschema.translate.translation import Translation, render
+from flexschema.translate.mongoengine.translate import translate as translate_mongoengine
+from flexschema.translate.structs.translate import translate as translate_structs
+
+SAMPLE_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'test', 'samples', 'many.json')
+
+# `User` and what it references; the rest of the sample is not needed here
+KEYS = ['VirtualFile', 'User']
+
+
+def load_module(name: str, translate: Callable[[AnySchema], Translation]) -> types.ModuleType:
+    file = open(SAMPLE_PATH, 'r')
+    json_data = json.loads(file.read())
+    file.close()
+
+    context: dict[str, AnySchema] = {}
+    translations: list[Translation] = []
+    for item in json_data:
+        schema = parse(item, context=context)
+        if not isinstance(schema, SchemaBase) or schema.key not in KEYS:
+            continue
+        context[schema.key] = schema
+        translations.append(translate(schema))
+
+    module = types.ModuleType(f'bench_{name}')
+    sys.modules[module.__name__] = module
+    exec(render(translations), module.__dict__)
+    return module
+
+
+def make_payloads(count: int) -> list[bytes]:
+    return [
+        json.dumps({
+            'firstname': f'first{i}',
+            'lastname': f'last{i}',
+            'email': f'user{i}@example.com',
+            'age': i % 100
+        }).encode()
+        for i in range(count)
+    ]
+
+
+def make_decoders() -> dict[str, Callable[[bytes], object] | None]:
+    decoders: dict[str, Callable[[bytes], object] | None] = {'mongoengine': None, 'dataclass': None, 'msgspec': None}
+
+    if importlib.util.find_spec('mongoengine'):
+        MongoUser = load_module('mongoengine', translate_mongoengine).User
+        decoders['mongoengine'] = lambda x: MongoUser(**json.loads(x))
+
+    User = load_module('dataclass', lambda x: translate_structs(x, import_refs=False)).User
+    decoders['dataclass'] = lambda x: User(**json.loads(x))
+
+    if importlib.util.find_spec('msgspec'):
+        import msgspec
+        decoder = msgspec.json.Decoder(load_module('msgspec', lambda x: translate_structs(x, msgspec=True, import_refs=False)).User)
+        decoders['msgspec'] = decoder.decode
+
+    return decoders
+
+
+def bench(decode: Callable[[bytes], object], payloads: list[bytes]) -> tuple[float, float]:
+    start = time.perf_counter()
+    for payload in payloads:
+        _ = decode(payload)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [decode(payload) for payload in payloads]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_instance = (after - before) / len(instances)
+    return len(payloads) / elapsed, per_instance
+
+
+def run():
+    parser = ArgumentParser()
+    _ = parser.add_argument('--count', required=False, type=int, default=100000, help='Payloads to decode per target')
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.count)
+
+    print(f'{"target":<12} {"decodes/s":>12} {"bytes/instance":>16}')
+    for name, decode in make_decoders().items():
+        if decode is None:
+            print(f'{name:<12} skipped, not installed (pip install -e \'.[bench]\')')
+            continue
+        throughput, per_instance = bench(decode, payloads)
+        print(f'{name:<12} {throughput:>12.0f} {per_instance:>16.0f}')
+
+
+if __name__ == '__main__':
+    run()
@@ -2,10 +2,12 @@
 
 from argparse import ArgumentParser
 from os.path import splitext
-from flexschema.schema.schema import AnySchema, SchemaBase, parse
-from flexschema.translate.translation import Translation
+from flexschema.schema.schema import AnySchema, SchemaBase
+from flexschema.schema.select import parse_many, parse_selected
+from flexschema.translate.translation import Translation, render
 from flexschema.translate.typescript.translate import translate as translate_typescript
 from flexschema.translate.mongoengine.translate import translate as translate_mongoengine
+from flexschema.translate.structs.translate import translate as translate_structs
 import dataclasses
 import json
 import os
@@ -35,6 +37,20 @@ _ = parser.add_argument(
     type=bool,
     help='If set, will just print'
 )
+_ = parser.add_argument(
+    '--python-models',
+    required=False,
+    type=str,
+    default='mongoengine',
+    choices=['mongoengine', 'dataclass', 'msgspec'],
+    help='Kind of python models to generate'
+)
+_ = parser.add_argument(
+    '--only',
+    required=False,
+    type=str,
+    help='Comma separated names of the schemas to generate, along with the schemas they reference'
+)
 
 ###########################
 #  Mongoengine options
@@ -94,17 +110,21 @@ def process_schema(schema: AnySchema, i: int, context: dict[str, AnySchema]) ->
 
     #write_and_close(typescript_filepath, typescript_code)
 
-    mongoengine_filename = f'{name}.py'
-    mongoengine_filepath = os.path.join(args.out_dir, mongoengine_filename) if args.out_dir else mongoengine_filename
-    extra_deps: list[str] = []
-    if args.mongoengine_base_class_import:
-        extra_deps.append(args.mongoengine_base_class_import)
-    mongoengine_code = translate_mongoengine(schema, base_class=args.mongoengine_base_class, extra_deps=extra_deps)
+    python_filename = f'{name}.py'
+    python_filepath = os.path.join(args.out_dir, python_filename) if args.out_dir else python_filename
+    if args.python_models == 'mongoengine':
+        extra_deps: list[str] = []
+        if args.mongoengine_base_class_import:
+            extra_deps.append(args.mongoengine_base_class_import)
+        python_code = translate_mongoengine(schema, base_class=args.mongoengine_base_class, extra_deps=extra_deps)
+    else:
+        # separate files need to import the models they reference
+        python_code = translate_structs(schema, msgspec=args.python_models == 'msgspec', import_refs=not args.out_name, context=context)
 
 
     return [
         TranslationUnit(translation=typescript_code, filepath=typescript_filepath),
-        TranslationUnit(translation=mongoengine_code, filepath=mongoengine_filepath)
+        TranslationUnit(translation=python_code, filepath=python_filepath)
     ]
     #return ProcessOutput(typescript_code=typescript_code, mongoengine_code=mongoengine_code)
 
@@ -117,61 +137,29 @@ def run():
     if not isinstance(json_data, list):
         raise Exception('Not an array') # pyright: ignore
 
-    
     context: dict[str, AnySchema] = {}
-    schemas: list[AnySchema] = []
 
-    for item in json_data:
-        schema = parse(item, context=context)
-        schemas.append(schema)
-        if isinstance(schema, SchemaBase):
-            key = schema.key
-            if key:
-                context[key] = schema
+    if args.only:
+        schemas = parse_selected(json_data, [x.strip() for x in args.only.split(',')], context=context)
+    else:
+        schemas = parse_many(json_data, context=context)
 
     if args.out_name and args.out_dir:
-        outputs: dict[str, list[str]] = {}
-        deps: dict[str, set[str]] = {}
-        heads: dict[str, set[str]] = {}
-        did_write_deps: bool = False
-        
+        translations: dict[str, list[Translation]] = {}
+
         for i, schema in enumerate(schemas):
             if isinstance(schema, SchemaBase):
                 units = process_schema(schema, i,  context)
 
                 for unit in units:
                     _, ext = splitext(unit.filepath)
-                    outputs[ext] = outputs.get(ext, []) or []
-                    outputs[ext].append(unit.translation.output)
-                    deps[ext] = deps.get(ext, set()) or set()
-                    deps[ext].update(unit.translation.deps)
-                    heads[ext] = heads.get(ext, set()) or set()
-                    heads[ext].update(unit.translation.head)
-
-        for k, v in outputs.items():
+                    translations[ext] = translations.get(ext, []) or []
+                    translations[ext].append(unit.translation)
+
+        for k, v in translations.items():
             filepath = os.path.basename(f'{args.out_name}{k}') 
             filepath = os.path.join(args.out_dir, filepath)
-            unit_heads = heads.get(k)
-
-            code = ''
-            
-            if unit_heads is not None and len(unit_heads) > 0:
-                code += '\n'.join(list(unit_heads))
-                code += '\n'
-                
-            code += '\n'.join(v)
-            
-            unit_deps = deps.get(k)
-
-                
-
-            if unit_deps and '#<DEPS>' in code and not did_write_deps:
-                deps_str = '\n'.join(list(unit_deps))
-                code = code.replace('#<DEPS>', deps_str + '\n', 1)
-                did_write_deps = True
-                code = code.replace('#<DEPS>', '')
-            
-            write_and_close(filepath, code)
+            write_and_close(filepath, render(v))
 
     elif args.out_dir:
         maybe_make_dir(args.out_dir)
@@ -181,20 +169,7 @@ def run():
                 units = process_schema(schema, i, context)
 
                 for unit in units:
-                    code = ''
-
-                    unit_heads = unit.translation.head
-                    code = ''
-
-                    if unit_heads and len(unit_heads) > 0:
-                        code += '\n'.join(list(unit_heads))
-                        code += '\n'
-                    
-                    code += unit.translation.output
-                    if '#<DEPS>' in code:
-                        deps_str = '\n'.join(list(unit.translation.deps))
-                        code = code.replace('#<DEPS>', deps_str + '\n')
-                    write_and_close(unit.filepath, code)
+                    write_and_close(unit.filepath, render([unit.translation]))
     else:
         raise Exception('--out-dir or --out-name must be specified')
             
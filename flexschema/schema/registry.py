@@ -0,0 +1,162 @@
+# pyright: basic
+
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+from flexschema.schema.schema import AnySchema, ESchemaType, SchemaArray, SchemaBase, SchemaObject, parse
+
+
+def _ref_key(ref: 'str | AnySchema | None') -> str | None:
+    if isinstance(ref, str):
+        return ref
+    if isinstance(ref, SchemaBase):
+        return ref.key
+    return None
+
+
+def walk(schema: AnySchema, crumbs: list[str | int]) -> Iterator[tuple[str, SchemaBase]]:
+    """
+    Yields `(path, node)` for `schema` and every schema nested below it.
+    Paths are `crumbs` followed by the keys leading to the node, joined by dots,
+    so walking `Order` from `['Order']` yields e.g `Order.properties.items.items`.
+    `$ref` targets are not followed.
+    """
+    if isinstance(schema, list):
+        for i, item in enumerate(schema):
+            yield from walk(item, [*crumbs, i])
+        return
+    if isinstance(schema, dict):
+        for k, v in schema.items():
+            yield from walk(v, [*crumbs, k])
+        return
+    if not isinstance(schema, SchemaBase):
+        return
+
+    yield '.'.join(map(lambda x: str(x), crumbs)), schema
+
+    if isinstance(schema, SchemaObject):
+        for pk, pv in schema.properties.items():
+            yield from walk(pv, [*crumbs, 'properties', pk])
+    elif isinstance(schema, SchemaArray) and schema.items is not None:
+        yield from walk(schema.items, [*crumbs, 'items'])
+
+    for i, item in enumerate(schema.anyOf):
+        yield from walk(item, [*crumbs, 'anyOf', i])
+
+
+class SchemaRegistry:
+    """
+    Indexes a set of top-level schemas (keyed by `schema.key`) for fast lookups:
+    by key, by `$id`, by path, by type, by `meta` key and by who `$ref`s whom.
+
+    Every index is a dict, so lookups are O(1) and listings are O(result).
+    `add` re-indexes a single top-level schema, replacing any previous one
+    with the same key, without touching the rest of the registry.
+    """
+
+    def __init__(self, schemas: Iterable[AnySchema] | None = None):
+        self._by_key: dict[str, AnySchema] = {}
+        # id -> path -> node, `$id` is not guaranteed to be unique
+        self._by_id: dict[str, dict[str, SchemaBase]] = {}
+        self._by_path: dict[str, SchemaBase] = {}
+        self._by_type: dict[ESchemaType, dict[str, SchemaBase]] = {}
+        self._by_meta: dict[str, dict[str, SchemaBase]] = {}
+        # referenced key -> path of referencing node -> key of its top-level schema
+        self._referrers: dict[str, dict[str, str]] = {}
+        # top-level key -> paths it contributed, used to undo `add` on replace
+        self._paths: dict[str, list[str]] = {}
+
+        for schema in schemas or []:
+            if isinstance(schema, SchemaBase) and schema.key:
+                self.add(schema)
+
+    def add(self, schema: AnySchema, key: str | None = None) -> None:
+        key = key or (schema.key if isinstance(schema, SchemaBase) else None)
+        if not key:
+            raise Exception('Cannot register a schema without a `title` or `name`')
+
+        self.remove(key)
+
+        paths: list[str] = []
+        for path, node in walk(schema, [key]):
+            paths.append(path)
+            self._by_path[path] = node
+            self._by_type.setdefault(node.type, {})[path] = node
+            if node.id:
+                self._by_id.setdefault(node.id, {})[path] = node
+            for mk in node.meta.keys():
+                self._by_meta.setdefault(mk, {})[path] = node
+            ref = _ref_key(node.ref)
+            if ref:
+                self._referrers.setdefault(ref, {})[path] = key
+
+        self._by_key[key] = schema
+        self._paths[key] = paths
+
+    def remove(self, key: str) -> AnySchema | None:
+        schema = self._by_key.pop(key, None)
+        for path in self._paths.pop(key, []):
+            node = self._by_path.pop(path, None)
+            if node is None:
+                continue
+            self._by_type.get(node.type, {}).pop(path, None)
+            if node.id:
+                self._by_id.get(node.id, {}).pop(path, None)
+            for mk in node.meta.keys():
+                self._by_meta.get(mk, {}).pop(path, None)
+            ref = _ref_key(node.ref)
+            if ref:
+                self._referrers.get(ref, {}).pop(path, None)
+        return schema
+
+    def parse(self, json_data: list[dict]) -> list[AnySchema]:
+        """ Parses top-level schemas in order, adding each keyed schema to the registry """
+        schemas: list[AnySchema] = []
+
+        for item in json_data:
+            schema = parse(item, context=self.context)
+            schemas.append(schema)
+            if isinstance(schema, SchemaBase) and schema.key:
+                self.add(schema)
+
+        return schemas
+
+    @property
+    def context(self) -> Mapping[str, AnySchema]:
+        """ Read-only view of the top-level schemas by key, suitable as the `context` of `parse` """
+        return MappingProxyType(self._by_key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def get(self, key: str) -> AnySchema | None:
+        return self._by_key.get(key)
+
+    def get_by_id(self, id: str) -> SchemaBase | None:
+        """ First registered node with the given `$id` """
+        return next(iter(self._by_id.get(id, {}).values()), None)
+
+    def get_by_path(self, path: str) -> SchemaBase | None:
+        return self._by_path.get(path)
+
+    def find_by_id(self, id: str) -> Mapping[str, SchemaBase]:
+        """ Nodes with the given `$id`, by path """
+        return MappingProxyType(self._by_id.get(id, {}))
+
+    def find_by_type(self, type: ESchemaType) -> Mapping[str, SchemaBase]:
+        """ Nodes of the given type, by path """
+        return MappingProxyType(self._by_type.get(type, {}))
+
+    def find_by_meta(self, meta_key: str) -> Mapping[str, SchemaBase]:
+        """ Nodes having `meta_key` in their `meta`, by path """
+        return MappingProxyType(self._by_meta.get(meta_key, {}))
+
+    def find_ref_sites(self, key: str) -> dict[str, SchemaBase]:
+        """ Nodes whose `$ref` points at `key`, by path """
+        return {path: self._by_path[path] for path in self._referrers.get(key, {})}
+
+    def find_referrers(self, key: str) -> list[str]:
+        """ Keys of the top-level schemas that `$ref` `key` somewhere """
+        return list(dict.fromkeys(self._referrers.get(key, {}).values()))
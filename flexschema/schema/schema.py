@@ -1,7 +1,7 @@
 # pyright: basic
 
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 import dataclasses
 from dataclasses import field as FIELD
 from enum import StrEnum
@@ -123,7 +123,7 @@ AnySchema: TypeAlias = SchemaNull | SchemaArray | SchemaObject | SchemaFloat | S
 
 def parse(
     data: dict,
-    context: dict[str, AnySchema] | None = None
+    context: Mapping[str, AnySchema] | None = None
 ) -> AnySchema:
     context = context or dict()
     
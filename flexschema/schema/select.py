@@ -0,0 +1,83 @@
+# pyright: basic
+
+from collections.abc import Iterable, Iterator
+from flexschema.schema.schema import AnySchema, SchemaBase, parse
+
+
+def raw_key(data: dict) -> str | None:
+    """ Same as `SchemaBase.key`, but on an unparsed schema """
+    return data.get('title') or data.get('name')
+
+
+def raw_refs(data: dict | list, properties: bool = False) -> Iterator[str]:
+    """
+    Yields every `$ref` string found anywhere in an unparsed schema.
+    `properties` tells that `data` maps property names to schemas rather than being a schema,
+    so its keys (`meta`, `$ref`, ...) are names, not keywords.
+    """
+    if isinstance(data, list) or properties:
+        for v in (data if isinstance(data, list) else data.values()):
+            if isinstance(v, (dict, list)):
+                yield from raw_refs(v)
+        return
+
+    for k, v in data.items():
+        if k == '$ref' and isinstance(v, str):
+            yield v
+        elif isinstance(v, (dict, list)) and k != 'meta':
+            yield from raw_refs(v, properties=k == 'properties' and isinstance(v, dict))
+
+
+def select(json_data: list[dict], keys: Iterable[str]) -> list[dict]:
+    """
+    Returns the unparsed top-level schemas named by `keys` together with
+    everything they transitively `$ref`, in input order.
+    Only the selected schemas are walked, the rest is left untouched.
+    """
+    by_key: dict[str, int] = {}
+    for i, item in enumerate(json_data):
+        key = raw_key(item) if isinstance(item, dict) else None
+        if key and key not in by_key:
+            by_key[key] = i
+
+    selected: set[int] = set()
+    pending: list[str] = list(keys)
+    for key in pending:
+        if key not in by_key:
+            raise Exception(f'Unknown schema `{key}`')
+
+    while len(pending) > 0:
+        key = pending.pop()
+        i = by_key.get(key)
+        if i is None or i in selected:
+            continue
+        selected.add(i)
+        pending.extend(raw_refs(json_data[i]))
+
+    return [json_data[i] for i in sorted(selected)]
+
+
+def parse_many(
+    json_data: list[dict],
+    context: dict[str, AnySchema] | None = None
+) -> list[AnySchema]:
+    """ Parses top-level schemas in order, registering each keyed schema in `context` """
+    context = context if context is not None else dict()
+    schemas: list[AnySchema] = []
+
+    for item in json_data:
+        schema = parse(item, context=context)
+        schemas.append(schema)
+        if isinstance(schema, SchemaBase) and schema.key:
+            context[schema.key] = schema
+
+    return schemas
+
+
+def parse_selected(
+    json_data: list[dict],
+    keys: Iterable[str],
+    context: dict[str, AnySchema] | None = None
+) -> list[AnySchema]:
+    """ Same as `parse_many`, but only for what `select` picks """
+    return parse_many(select(json_data, keys), context=context)
@@ -17,6 +17,16 @@ def first_upper(x: str):
         return x
     return x[0].upper() + x[1:]
 
+python_types:dict[str, str] = {
+    'string': 'str',
+    'number': 'float',
+    'int': 'int',
+    'integer': 'int',
+    'StringField': 'str',
+    'IntField': 'int',
+    'FloatField': 'float'
+}
+
 def _translate(schema: AnySchema, base_class: str = 'Document', extra_deps: list[str] | None = None) -> Translation:
     enums: list[str] = []
     classes: list[str] = []
@@ -29,16 +39,6 @@ def _translate(schema: AnySchema, base_class: str = 'Document', extra_deps: list
         deps.add('from mongoengine import Document')
 
 
-    python_types:dict[str, str] = {
-        'string': 'str',
-        'number': 'float',
-        'int': 'int',
-        'integer': 'int',
-        'StringField': 'str',
-        'IntField': 'int',
-        'FloatField': 'float'
-    }
-
     def make_enum(name: str, keys: list[str]):
         ename = f'E{first_upper(name)}'
         content = ''
@@ -0,0 +1,165 @@
+# pyright: basic
+from collections.abc import Mapping
+from flexschema.schema.schema import AnySchema, ESchemaType, SchemaBase, SchemaObject
+from flexschema.translate.mongoengine.translate import first_upper, pad_left, python_types
+from flexschema.translate.translation import Translation
+
+def _translate(
+    schema: AnySchema,
+    msgspec: bool = False,
+    import_refs: bool = True,
+    context: Mapping[str, AnySchema] | None = None,
+    extra_deps: list[str] | None = None
+) -> Translation:
+    enums: list[str] = []
+    classes: list[str] = []
+    deps: set[str] = set()
+    context = context or dict()
+
+    if extra_deps is not None:
+        deps.update(extra_deps)
+
+    if msgspec:
+        deps.add('import msgspec')
+    else:
+        deps.add('import dataclasses')
+
+    def classname(name: str) -> str:
+        return first_upper(name.replace(' ', ''))
+
+    def make_enum(name: str, keys: list[str]):
+        ename = f'E{name}'
+        content = ''
+        content += f'class {ename}(StrEnum):\n'
+        content += '\n'.join(list(map(lambda x: f'{pad_left(x, 4)} = "{x}"', keys)))
+        enums.append(content)
+        return ename
+
+    def resolve_ref(schema: SchemaBase) -> SchemaBase | None:
+        # `parse` only resolves refs to schemas defined before the referencing one
+        if isinstance(schema.ref, SchemaBase):
+            return schema.ref
+        if isinstance(schema.ref, str):
+            other = context.get(schema.ref)
+            if not isinstance(other, SchemaBase):
+                raise Exception(f'{schema.key}: unknown `$ref` `{schema.ref}`, pass the parsed schemas as `context`')
+            return other
+        return None
+
+    def ref_name(other: SchemaBase) -> str:
+        key = other.key or '_unknown_'
+        name = classname(key)
+        if len(other.enum) > 0:
+            name = f'E{name}'
+        if not import_refs or key == root_key:
+            return name
+        # the CLI writes each top-level schema to `<key without spaces>.py`;
+        # importing the module rather than the name lets models reference each other
+        module = key.replace(' ', '')
+        deps.add(f'from . import {module}')
+        return f'{module}.{name}'
+
+    def get_default(schema: SchemaBase, mark: str) -> str | None:
+        other = resolve_ref(schema)
+        keys = other.enum if other else (schema.enum if schema.type == ESchemaType.STRING else [])
+        if len(keys) > 0 and schema.default in keys:
+            return f'{mark}.{schema.default}'
+        if isinstance(schema.default, (list, dict)):
+            factory = 'msgspec.field' if msgspec else 'dataclasses.field'
+            return f'{factory}(default_factory=lambda: {repr(schema.default)})'
+        if schema.default is not None:
+            return repr(schema.default)
+        if schema.required is not True:
+            return 'None'
+        return None
+
+    def make_class(schema: SchemaObject, name: str):
+        content = ''
+
+        if msgspec:
+            content += f'class {name}(msgspec.Struct, frozen=True, kw_only=True):\n'
+        else:
+            content += '@dataclasses.dataclass(slots=True, frozen=True, kw_only=True)\n'
+            content += f'class {name}:\n'
+
+        for k, v in schema.properties.items():
+            # nested models are named after their parent so they can't shadow top-level ones
+            mark = trans(v, f'{name}{classname(k)}')
+            default = get_default(v, mark) if isinstance(v, SchemaBase) else None
+            if default == 'None' and mark != 'None':
+                mark = f'{mark} | None'
+            suffix = f' = {default}' if default is not None else ''
+            content += pad_left(f'{k}: {mark}{suffix}\n', 4)
+
+        if len(schema.properties) <= 0:
+            content += pad_left('pass\n', 4)
+
+        classes.append(content)
+        return name
+
+    def trans(schema: AnySchema, name: str) -> str:
+        if isinstance(schema, (list, dict)):
+            deps.add('from typing import Any')
+            return 'Any'
+        other = resolve_ref(schema)
+        if other is not None:
+            return ref_name(other)
+        elif len(schema.anyOf) > 0:
+            return ' | '.join(dict.fromkeys(trans(x, f'{name}{i}') for i, x in enumerate(schema.anyOf)))
+        elif schema.type == ESchemaType.OBJECT:
+            return make_class(schema, name)
+        elif schema.type == ESchemaType.STRING and schema.enum:
+            deps.add('from enum import StrEnum')
+            return make_enum(name, schema.enum)
+        elif schema.type == ESchemaType.ARRAY:
+            if schema.items:
+                return f'list[{trans(schema.items, f"{name}Item")}]'
+            deps.add('from typing import Any')
+            return 'list[Any]'
+        elif schema.type == ESchemaType.DATE:
+            deps.add('import datetime')
+            return 'datetime.datetime'
+        elif schema.type == ESchemaType.NULL:
+            return 'None'
+        elif schema.type == ESchemaType.BOOLEAN:
+            return 'bool'
+        elif schema.type == ESchemaType.UNKNOWN:
+            if schema.typename == 'file':
+                return 'bytes'
+        pytype = python_types.get(schema.type)
+        if pytype:
+            return pytype
+        deps.add('from typing import Any')
+        return 'Any'
+
+
+
+    root_key = schema.key if isinstance(schema, SchemaBase) else None
+    contents = '#<DEPS>'
+    _ = trans(schema, classname(root_key or 'SomeObject'))
+
+    if len(enums) > 0:
+        contents += '\n'
+        contents += '\n'.join(enums)
+        contents += '\n'
+
+    if len(classes) > 0:
+        contents += '\n'
+        contents += '\n'.join(classes)
+
+    # annotations may name models defined further down or in other units
+    return Translation(output=contents, deps=deps, extension='.py', head=['# pyright: basic', 'from __future__ import annotations'])
+
+
+def translate(
+    schema: AnySchema,
+    msgspec: bool = False,
+    import_refs: bool = True,
+    context: Mapping[str, AnySchema] | None = None,
+    extra_deps: list[str] | None = None
+) -> Translation:
+    """
+    `context` maps keys to the other parsed top-level schemas,
+    it is needed to resolve `$ref`s to schemas defined after `schema`.
+    """
+    return _translate(schema, msgspec=msgspec, import_refs=import_refs, context=context, extra_deps=extra_deps)
@@ -7,3 +7,30 @@ class Translation:
     extension: str
     deps: set[str] = FIELD(default_factory=set)
     head: list[str] = FIELD(default_factory=list)
+
+
+def render(translations: list[Translation]) -> str:
+    """
+    Joins translations into the contents of a single file:
+    their heads, then their outputs, with all deps written at the first `#<DEPS>`.
+    """
+    heads: list[str] = []
+    deps: set[str] = set()
+    for translation in translations:
+        for head in translation.head:
+            if head not in heads:
+                heads.append(head)
+        deps.update(translation.deps)
+
+    code = ''
+
+    if len(heads) > 0:
+        code += '\n'.join(heads)
+        code += '\n'
+
+    code += '\n'.join(map(lambda x: x.output, translations))
+
+    if len(deps) > 0 and '#<DEPS>' in code:
+        code = code.replace('#<DEPS>', '\n'.join(sorted(deps)) + '\n', 1)
+
+    return code.replace('#<DEPS>', '')
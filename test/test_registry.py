@@ -0,0 +1,60 @@
+# pyright: basic
+import pytest
+from .utils import load_sample
+from flexschema.schema.schema import ESchemaType, SchemaObject, SchemaString
+from flexschema.schema.registry import SchemaRegistry
+
+def load_registry() -> SchemaRegistry:
+    registry = SchemaRegistry()
+    _ = registry.parse(load_sample('many.json'))
+    return registry
+
+def test_lookups():
+    registry = load_registry()
+
+    assert 'User' in registry
+    assert registry.get_by_id('https://example.com/complex-object.schema.json') is registry.get('Complex Object')
+    assert registry.get_by_path('Complex Object.properties.hobbies.items').type == ESchemaType.STRING
+    assert list(registry.find_by_type(ESchemaType.DATE).keys()) == ['Article.properties.date_published']
+    assert list(registry.find_by_meta('baseclass_args').keys()) == ['Complex Object']
+
+def test_referrers():
+    registry = load_registry()
+
+    assert registry.find_referrers('Stuff') == ['Complex Object']
+    assert registry.find_referrers('VirtualFile') == ['User']
+    assert list(registry.find_ref_sites('VirtualFile').keys()) == ['User.properties.avatar']
+
+def test_replace():
+    registry = load_registry()
+
+    registry.add(SchemaObject(title='User', properties={'nick': SchemaString(name='nick')}))
+
+    assert registry.find_referrers('VirtualFile') == []
+    assert registry.get_by_path('User.properties.avatar') is None
+    assert registry.get_by_path('User.properties.nick') is not None
+    assert len(registry) == 5
+
+def test_duplicate_id():
+    registry = load_registry()
+
+    registry.add(SchemaObject(title='Other', id='https://example.com/complex-object.schema.json'))
+    registry.remove('Other')
+
+    assert registry.get_by_id('https://example.com/complex-object.schema.json') is registry.get('Complex Object')
+
+def test_readonly():
+    registry = load_registry()
+
+    with pytest.raises(TypeError):
+        registry.find_by_type(ESchemaType.DATE)['x'] = SchemaString()  # pyright: ignore
+
+    with pytest.raises(TypeError):
+        registry.context['x'] = SchemaString()  # pyright: ignore
+
+def test_parse():
+    registry = load_registry()
+
+    assert registry.get_by_path('User') is registry.get('User')
+    assert 'User' in registry.find_by_type(ESchemaType.OBJECT)
+    assert registry.get_by_path('User.properties.avatar').ref is registry.get('VirtualFile')
@@ -0,0 +1,30 @@
+# pyright: basic
+import pytest
+from .utils import load_sample
+from flexschema.schema.schema import SchemaBase
+from flexschema.schema.select import parse_selected, select
+
+def test_select():
+    data = load_sample('many.json')
+
+    assert [x['title'] for x in select(data, ['User'])] == ['VirtualFile', 'User']
+    assert [x['title'] for x in select(data, ['Article', 'Complex Object'])] == ['Stuff', 'Complex Object', 'Article']
+
+    nested_meta = [
+        {'title': 'A', 'type': 'object', 'meta': {'$ref': 'C'}, 'properties': {'meta': {'type': 'object', '$ref': 'B'}}},
+        {'title': 'B', 'type': 'object'},
+        {'title': 'C', 'type': 'object'}
+    ]
+    assert [x['title'] for x in select(nested_meta, ['A'])] == ['A', 'B']
+
+    with pytest.raises(Exception):
+        select(data, ['Nope'])
+
+def test_parse_selected():
+    context = {}
+    schemas = parse_selected(load_sample('many.json'), ['User'], context=context)
+
+    assert list(context.keys()) == ['VirtualFile', 'User']
+    user = schemas[-1]
+    assert isinstance(user, SchemaBase)
+    assert user.properties['avatar'].ref is context['VirtualFile']
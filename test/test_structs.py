@@ -0,0 +1,126 @@
+# pyright: basic
+import datetime
+import importlib
+import sys
+import types
+import typing
+import pytest
+from .utils import load_sample
+from flexschema.schema.schema import AnySchema, SchemaBase, parse
+from flexschema.schema.select import parse_many
+from flexschema.translate.structs.translate import translate
+from flexschema.translate.translation import Translation, render
+
+def translate_many(json_data: list[dict], msgspec: bool = False, import_refs: bool = False) -> dict[str, Translation]:
+    context: dict[str, AnySchema] = {}
+    schemas = parse_many(json_data, context=context)
+    translations: dict[str, Translation] = {}
+    for schema in schemas:
+        if isinstance(schema, SchemaBase) and schema.key:
+            translations[schema.key.replace(' ', '')] = translate(schema, msgspec=msgspec, import_refs=import_refs, context=context)
+    return translations
+
+def load_module(name: str, translations: list[Translation]) -> types.ModuleType:
+    module = types.ModuleType(name)
+    sys.modules[module.__name__] = module
+    exec(render(translations), module.__dict__)
+    return module
+
+def load_package(tmp_path, name: str, translations: dict[str, Translation]) -> types.ModuleType:
+    package = tmp_path / name
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    for key, translation in translations.items():
+        (package / f'{key}.py').write_text(render([translation]))
+
+    sys.path.insert(0, str(tmp_path))
+    try:
+        for key in translations.keys():
+            _ = importlib.import_module(f'{name}.{key}')
+        return importlib.import_module(name)
+    finally:
+        sys.path.remove(str(tmp_path))
+
+def test_nested():
+    module = load_module('structs_nested', [translate(parse(load_sample('nested.json')))])
+
+    assert module.ComplexObject.__dataclass_fields__['address'].type == 'ComplexObjectAddress | None'
+    assert module.ComplexObject.__dataclass_fields__['category'].default == module.EComplexObjectCategory.ACTION
+
+    obj = module.ComplexObject(name='a', age=1, address=module.ComplexObjectAddress(street='a', city='b', state='c', postalCode='d'))
+    assert obj.address.city == 'b'
+    assert obj.category == module.EComplexObjectCategory.ACTION
+
+def test_dataclass():
+    module = load_module('structs_dataclass', list(translate_many(load_sample('many.json')).values()))
+
+    user = module.User(firstname='a', lastname='b', email='c')
+    assert user.age == 42
+    assert user.avatar is None
+    assert not hasattr(user, '__dict__')
+
+    article = module.Article(title='a', text='b', date_published=datetime.datetime.now())
+    assert module.ComplexObject(name='a', age=1, category=module.EStuff.STUFF1).hobbies is None
+    assert article.title == 'a'
+
+def test_enum_default_outside_enum():
+    # `ACTION` is not one of `Stuff`, the default is kept as is rather than validated
+    module = load_module('structs_enum_default', list(translate_many(load_sample('many.json')).values()))
+
+    assert module.ComplexObject(name='a', age=1).category == 'ACTION'
+
+def test_nested_name_collision():
+    json_data = [
+        {'title': 'Order', 'type': 'object', 'properties': {
+            'user': {'type': 'object', 'properties': {'nick': {'type': 'string', 'required': True}}},
+            'buyer': {'type': 'object', '$ref': 'User', 'required': True}
+        }},
+        {'title': 'User', 'type': 'object', 'properties': {'email': {'type': 'string', 'required': True}}}
+    ]
+    module = load_module('structs_collision', list(translate_many(json_data).values()))
+
+    assert module.Order(buyer=module.User(email='e')).buyer.email == 'e'
+    assert module.OrderUser(nick='n').nick == 'n'
+
+def test_forward_enum_ref():
+    json_data = [
+        {'title': 'Item', 'type': 'object', 'properties': {
+            'stuff': {'type': 'array', 'items': {'type': 'string', '$ref': 'Stuff2'}, 'required': True}
+        }},
+        {'title': 'Stuff2', 'type': 'string', 'enum': ['A', 'B']}
+    ]
+    module = load_module('structs_forward', list(translate_many(json_data).values()))
+
+    assert typing.get_type_hints(module.Item)['stuff'] == list[module.EStuff2]
+
+    with pytest.raises(Exception):
+        translate(parse(json_data[0]))
+
+def test_msgspec():
+    msgspec = pytest.importorskip('msgspec')
+    module = load_module('structs_msgspec', list(translate_many(load_sample('many.json'), msgspec=True).values()))
+
+    user = msgspec.json.decode(b'{"firstname": "a", "lastname": "b", "email": "c"}', type=module.User)
+    assert user.age == 42
+
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(b'{"firstname": "a"}', type=module.User)
+
+def test_separate_files(tmp_path):
+    msgspec = pytest.importorskip('msgspec')
+    package = load_package(tmp_path, 'structs_package', translate_many(load_sample('many.json'), msgspec=True, import_refs=True))
+
+    assert typing.get_type_hints(package.ComplexObject.ComplexObject)['category'].__name__ == 'EStuff'
+    user = msgspec.json.decode(b'{"firstname": "a", "lastname": "b", "email": "c", "avatar": {"id": "1", "name": "x"}}', type=package.User.User)
+    assert user.avatar.name == 'x'
+
+def test_separate_files_cycle(tmp_path):
+    msgspec = pytest.importorskip('msgspec')
+    json_data = [
+        {'title': 'Org', 'type': 'object', 'properties': {'owner': {'type': 'object', '$ref': 'Person'}}},
+        {'title': 'Person', 'type': 'object', 'properties': {'org': {'type': 'object', '$ref': 'Org'}}}
+    ]
+    package = load_package(tmp_path, 'structs_cycle', translate_many(json_data, msgspec=True, import_refs=True))
+
+    org = msgspec.json.decode(b'{"owner": {"org": {}}}', type=package.Org.Org)
+    assert isinstance(org.owner.org, package.Org.Org)